@@ -0,0 +1,80 @@
+# Python Libraries
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    # numba is optional (pip install abcmrt16[fast]); callers fall back to
+    # pure numpy implementations when it is not installed
+    numba = None
+
+"""
+Optional compiled kernels for the ABC_MRT16 algorithm.
+
+The hot sliding-correlation sweep compiles to tight machine code with numba
+when it is available. Each kernel name is bound to None when numba is not
+installed so ABC_MRT16 can test availability and dispatch to its numpy
+fallbacks. Per-clip parallelism lives in process's thread pool, so the
+kernels themselves stay single threaded.
+"""
+
+if numba is not None:
+
+    @numba.njit(cache=True, error_model="numpy")
+    def group_corr_kernel(X, R):  # pragma: no cover
+        """
+        Purpose
+        -------
+        Computes the correlation value for every alignment of R with X as
+        tight compiled loops with no temporary arrays. NaN values from a
+        zero-variance window are preserved so np.nanargmax sees the same
+        values as the numpy fallback.
+
+        Parameters
+        ----------
+            X : numpy array
+                Time-frequency representation. Must be C contiguous.
+
+            R : numpy array
+                Normalized template rows. Must be C contiguous.
+
+        Returns
+        -------
+            C : numpy vector
+                Correlation value for each shift.
+        """
+
+        nrows = X.shape[0]
+        n = X.shape[1]
+        q = R.shape[1]
+
+        nshifts = n - q + 1
+
+        C = np.empty(nshifts)
+
+        for i in range(nshifts):
+            c = 0.0
+            for r in range(nrows):
+                # Mean of this row of the window
+                s = 0.0
+                for j in range(q):
+                    s += X[r, i + j]
+                mean = s / q
+
+                # Accumulate sum of squares and template dot product of the
+                # mean-removed row in a single pass
+                ss = 0.0
+                dot = 0.0
+                for j in range(q):
+                    d = X[r, i + j] - mean
+                    ss += d * d
+                    dot += d * R[r, j]
+
+                c += dot / np.sqrt(ss)
+
+            C[i] = c
+
+        return C
+
+else:
+    group_corr_kernel = None
@@ -23,7 +23,10 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     install_requires=[
-        'numpy','scipy'
+        'numpy','scipy>=1.4'
     ],
+    extras_require={
+        'fast':['numba']
+    },
     python_requires='>=3.6',
 )
@@ -0,0 +1,89 @@
+#Python Libraries
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+#Custom Modules
+import abcmrt
+
+from generate_files import evaluate_csv, generate_csv, generate_file_paths, generate_speech_vectors
+
+#Talkers used by every condition
+TALKERS = ('F1', 'F3', 'M3', 'M4')
+
+"""
+Developer entry point that runs the full 30-condition 2008 test matrix with
+one worker process per condition:
+
+    python -m run_parallel          (from the tests directory)
+
+The conditions are independent, so the matrix is embarrassingly parallel
+across processes. Each worker loads the templates on its own, which is cheap
+because the per-version template cache is memory mapped and its pages are
+shared between workers. unittest (test_2008.py) remains the CI entry point;
+this driver exists for quickly turning the matrix around on a workstation.
+"""
+
+def run_condition(cnum):
+    """
+    Purpose
+    -------
+    Runs one 2008 condition end to end: enumerate the audio, score it with
+    abcmrt and compare the generated csv against the MATLAB reference.
+
+    Parameters
+    ----------
+    cnum : int
+           Condition number between 1 and 30.
+
+    Returns
+    -------
+    cnum : int
+           The condition number, passed through for reporting.
+    match : boolean
+            True if the Python and MATLAB csv files match.
+    """
+
+    partnum = (cnum - 1) // 10 + 1
+
+    #Can modify directory if needed
+    audio_dir = os.path.join(os.path.dirname(__file__), '2008 study', f'audio2008_part{partnum}', f'c{cnum:02}_2008')
+
+    #Generate audio file paths, file numbers and speech vectors for this condition
+    c_file_paths = generate_file_paths(TALKERS, audio_dir, condition=f'c{cnum:02}')
+    file_num = abcmrt.file2numbers(c_file_paths)
+    c_speech = generate_speech_vectors(c_file_paths)
+
+    #Generate file paths for csv files
+    python_csv = os.path.join(os.path.dirname(__file__), 'csv', 'python', f'2008 part {partnum}', f'python_2008_part{partnum}_c{cnum:02}.csv')
+    matlab_csv = os.path.join(os.path.dirname(__file__), 'csv', 'matlab', f'2008 part {partnum}', f'matlab_2008_part{partnum}_c{cnum:02}.csv')
+    diff_csv = os.path.join(os.path.dirname(__file__), 'csv', 'diff', f'2008 part {partnum}', f'diff_2008_part{partnum}_c{cnum:02}.csv')
+
+    #Run condition
+    _, c_success = abcmrt.process(c_speech, file_num, verbose=False)
+
+    generate_csv(c_success, c_file_paths, python_csv)
+
+    return cnum, evaluate_csv(python_csv, matlab_csv, diff_csv)
+
+def main():
+    """
+    Purpose
+    -------
+    Runs all 30 conditions across a process pool and reports per-condition
+    results. Exits nonzero if any condition mismatches the MATLAB reference.
+    """
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(run_condition, range(1, 31)))
+
+    mismatches = 0
+    for cnum, match in results:
+        print(f"c{cnum:02}: {'match' if match else 'MISMATCH'}")
+        mismatches += not match
+
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,14 @@
 #Python Libraries
 import os
 import unittest
-import numpy as np
 
 #Custom Modules
 import abcmrt
 from generate_files import generate_file_paths, generate_speech_vectors, generate_csv, evaluate_csv
 
+#Talkers used by every condition
+TALKERS = ('F1', 'F3', 'M3', 'M4')
+
 class TestABC_MRT16(unittest.TestCase):
     """
     Purpose
@@ -38,11 +40,8 @@ class TestABC_MRT16(unittest.TestCase):
         #Can modify directory if needed
         audio_dir = os.path.join(os.curdir, '2008 study', 'audio2008_part1', 'c03_2008')
         
-        #Specify talkers
-        talkers = np.array(['F1', 'F3', 'M3', 'M4'])
-       
         #For each condition, generate a list of audio file paths 
-        cls.c03_file_paths = generate_file_paths(talkers, audio_dir, condition='c03')
+        cls.c03_file_paths = generate_file_paths(TALKERS, audio_dir, condition='c03')
         
         #Generate list of files numbers (will be used for all conditions)
         cls.file_num = [abcmrt.file2number(file) for file in cls.c03_file_paths]
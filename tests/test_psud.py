@@ -7,8 +7,11 @@ import unittest
 import abcmrt
 from generate_files import generate_speech_vectors, generate_csv, evaluate_csv
 
+#Pattern for pulling the word number out of a PSuD clip name, compiled once
+_PSUD_FILE_RE = re.compile(r'Rx\d+_[MF]\d_.+_cp\d+_w(?P<word>\d+)\.wav')
+
 def generate_psud_file_num(file):
-    m=re.search('Rx\d+_[MF]\d_.+_cp\d+_w(?P<word>\d+)\.wav', file)
+    m=_PSUD_FILE_RE.search(file)
     return int(m.group('word'))
 
 class TestABC_MRT16(unittest.TestCase):
@@ -37,11 +40,12 @@ class TestABC_MRT16(unittest.TestCase):
         P25p2_dir = os.path.join(os.curdir, 'ABC_MRT_clips', 'P25p2')
         P25t_dir = os.path.join(os.curdir, 'ABC_MRT_clips', 'P25t')
         
-        #For each psud directory, generate a list of audio file paths 
-        cls.analog_file_paths = [os.path.join(analog_dir, file) for file in os.listdir(analog_dir) if file.endswith(".wav")]
-        cls.P25d_file_paths = [os.path.join(P25d_dir, file) for file in os.listdir(P25d_dir) if file.endswith(".wav")] 
-        cls.P25p2_file_paths = [os.path.join(P25p2_dir, file) for file in os.listdir(P25p2_dir) if file.endswith(".wav")]
-        cls.P25t_file_paths = [os.path.join(P25t_dir, file) for file in os.listdir(P25t_dir) if file.endswith(".wav")] 
+        #For each psud directory, generate a list of audio file paths in one
+        #scandir pass (dirent data, no extra stat calls per file)
+        cls.analog_file_paths = [e.path for e in os.scandir(analog_dir) if e.is_file() and e.name.endswith(".wav")]
+        cls.P25d_file_paths = [e.path for e in os.scandir(P25d_dir) if e.is_file() and e.name.endswith(".wav")]
+        cls.P25p2_file_paths = [e.path for e in os.scandir(P25p2_dir) if e.is_file() and e.name.endswith(".wav")]
+        cls.P25t_file_paths = [e.path for e in os.scandir(P25t_dir) if e.is_file() and e.name.endswith(".wav")]
         
         #For each psud directory, generate a list of file numbers
         cls.analog_file_nums = [generate_psud_file_num(file) for file in cls.analog_file_paths]
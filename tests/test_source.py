@@ -1,7 +1,6 @@
 #Python Libraries
 import os
 import unittest
-import numpy as np
 
 #Custom Modules
 import abcmrt
@@ -43,8 +42,8 @@ class TestABC_MRT16(unittest.TestCase):
         M4_paths = generate_file_paths(['M4'], M4_dir, condition='orig', pad_flag=False)
         cls.file_paths = F1_paths + F3_paths + M3_paths + M4_paths
 
-        #Generate a list of file numbers
-        cls.file_nums = [abcmrt.file2number(file) for file in cls.file_paths]
+        #Generate an array of file numbers
+        cls.file_nums = abcmrt.file2numbers(cls.file_paths)
         
         #Generate a list of speech vectors
         cls.speech = generate_speech_vectors(cls.file_paths)